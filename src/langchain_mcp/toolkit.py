@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import asyncio
+import threading
 import warnings
 from collections.abc import Callable
 
@@ -22,8 +23,9 @@ class MCPToolkit(BaseToolkit):
     """The MCP session used to obtain the tools"""
 
     _tools: ListToolsResult | None = None
+    _tool_list: list[BaseTool] | None = None
 
-    model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
+    model_config = pydantic.ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     async def initialize(self) -> None:
         """Initialize the session and retrieve tools list"""
@@ -36,16 +38,19 @@ class MCPToolkit(BaseToolkit):
         if self._tools is None:
             raise RuntimeError("Must initialize the toolkit first")
 
-        return [
-            MCPTool(
-                session=self.session,
-                name=tool.name,
-                description=tool.description or "",
-                args_schema=tool.inputSchema,
-            )
-            # list_tools returns a PaginatedResult, but I don't see a way to pass the cursor to retrieve more tools
-            for tool in self._tools.tools
-        ]
+        if self._tool_list is None:
+            self._tool_list = [
+                MCPTool(
+                    session=self.session,
+                    name=tool.name,
+                    description=tool.description or "",
+                    args_schema=tool.inputSchema,
+                )
+                # list_tools returns a PaginatedResult, but I don't see a way to pass the cursor to retrieve more tools
+                for tool in self._tools.tools
+            ]
+        # Copy so callers mutating the returned list don't affect the cache
+        return list(self._tool_list)
 
 
 class MCPTool(BaseTool):
@@ -57,19 +62,50 @@ class MCPTool(BaseTool):
     handle_tool_error: bool | str | Callable[[ToolException], str] | None = True
     response_format: t.Literal["content", "content_and_artifact"] = "content_and_artifact"
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     @t.override
     def _run(self, *args: t.Any, **kwargs: t.Any) -> tuple[str, list[ImageContent | EmbeddedResource]]:
         warnings.warn(
             "Invoke this tool asynchronousely using `ainvoke`. This method exists only to satisfy standard tests.",
             stacklevel=1,
         )
-        return asyncio.run(self._arun(*args, **kwargs))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # The session is bound to the running loop, blocking on it here would deadlock
+            raise RuntimeError("Cannot invoke synchronously from a running event loop, use `ainvoke` instead")
+        return asyncio.run_coroutine_threadsafe(self._arun(*args, **kwargs), _get_loop()).result()
 
     @t.override
     async def _arun(self, *args: t.Any, **kwargs: t.Any) -> tuple[str, list[ImageContent | EmbeddedResource]]:
         result = await self.session.call_tool(self.name, arguments=kwargs)
         if result.isError:
-            raise ToolException(pydantic_core.to_json(result.content).decode())
+            raise ToolException(_content_to_str(result.content))
         text_content = [block for block in result.content if isinstance(block, TextContent)]
         artifacts = [block for block in result.content if not isinstance(block, TextContent)]
-        return pydantic_core.to_json(text_content).decode(), artifacts
+        return _content_to_str(text_content), artifacts
+
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    # Persistent background loop for sync invocations, so each call doesn't create and tear down a new loop
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="langchain-mcp-loop", daemon=True).start()
+        return _loop
+
+
+def _content_to_str(content: t.Sequence[TextContent | ImageContent | EmbeddedResource]) -> str:
+    # A single text block is by far the most common result, return its text as-is
+    # instead of JSON encoding the block and decoding the bytes back to str
+    if len(content) == 1 and isinstance(content[0], TextContent):
+        return content[0].text
+    return pydantic_core.to_json(content).decode()
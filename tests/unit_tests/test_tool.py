@@ -1,8 +1,12 @@
 # Copyright (C) 2024 Andrew Wason
 # SPDX-License-Identifier: MIT
 
+import json
+
 import pytest
+from langchain_core.tools.base import ToolException
 from langchain_tests.unit_tests import ToolsUnitTests
+from mcp.types import CallToolResult, TextContent
 
 
 @pytest.mark.usefixtures("mcptool")
@@ -14,3 +18,42 @@ class TestMCPToolUnit(ToolsUnitTests):
     @property
     def tool_invoke_params_example(self) -> dict:
         return {"path": "LICENSE"}
+
+
+@pytest.mark.usefixtures("mcptool")
+class TestMCPToolResult:
+    async def test_single_text_content(self):
+        content, artifacts = await self.tool._arun(path="LICENSE")
+        assert content == "MIT License\n\nCopyright (c) 2024 Andrew Wason\n"
+        assert artifacts == []
+
+    async def test_multiple_text_content(self, monkeypatch):
+        monkeypatch.setattr(
+            self.tool.session.call_tool,
+            "return_value",
+            CallToolResult(
+                content=[TextContent(type="text", text="one"), TextContent(type="text", text="two")],
+                isError=False,
+            ),
+        )
+        content, artifacts = await self.tool._arun(path="LICENSE")
+        assert [(block["type"], block["text"]) for block in json.loads(content)] == [("text", "one"), ("text", "two")]
+        assert artifacts == []
+
+    async def test_error_content(self, monkeypatch):
+        monkeypatch.setattr(
+            self.tool.session.call_tool,
+            "return_value",
+            CallToolResult(content=[TextContent(type="text", text="File not found")], isError=True),
+        )
+        with pytest.raises(ToolException, match="^File not found$"):
+            await self.tool._arun(path="LICENSE")
+
+    def test_sync_run(self):
+        with pytest.warns(UserWarning):
+            content, _ = self.tool._run(path="LICENSE")
+        assert content == "MIT License\n\nCopyright (c) 2024 Andrew Wason\n"
+
+    async def test_sync_run_in_running_loop(self):
+        with pytest.warns(UserWarning), pytest.raises(RuntimeError, match="ainvoke"):
+            self.tool._run(path="LICENSE")
@@ -0,0 +1,12 @@
+# Copyright (C) 2024 Andrew Wason
+# SPDX-License-Identifier: MIT
+
+
+class TestMCPToolkit:
+    async def test_get_tools_cached(self, mcptoolkit):
+        await mcptoolkit.initialize()
+        tools = mcptoolkit.get_tools()
+        again = mcptoolkit.get_tools()
+        assert tools is not again
+        assert len(tools) == len(again)
+        assert all(a is b for a, b in zip(tools, again, strict=True))